@@ -14,10 +14,23 @@ from ..utils import mapping, lipdutils, plotting
 import warnings
 
 from collections import Counter
+from functools import lru_cache
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
+
+
+@lru_cache(maxsize=128)
+def _resolve_archive(archiveType):
+    '''Memoized resolution of an archiveType string against the LiPD ontology.
+
+    Falls back to 'Other' when the resolved name has no entry in
+    lipdutils.PLOT_DEFAULT, so the result can be used for plotting defaults directly.
+    '''
+    resolved = lipdutils.LipdToOntology(archiveType)
+    if resolved not in lipdutils.PLOT_DEFAULT.keys():
+        resolved = 'Other'
+    return resolved
+
 
 class EnsembleGeoSeries(EnsembleSeries):
     ''' EnsembleSeries object
@@ -500,7 +513,7 @@ class EnsembleGeoSeries(EnsembleSeries):
     def dashboard(self, figsize=[11, 8], gs=None, plt_kwargs=None, histplt_kwargs=None, spectral_kwargs=None,
                   spectralfig_kwargs=None, map_kwargs=None,
                   hue='archiveType', marker='archiveType', size=None, scatter_kwargs=None,
-                  gridspec_kwargs=None,
+                  gridspec_kwargs=None, psd_cache=None, preprocess=True,
                   savefig_settings=None):
         '''Dashboard that plots the trace, histogram, map, and power spectrum of the ensemble.
 
@@ -560,6 +573,19 @@ class EnsembleGeoSeries(EnsembleSeries):
             Optional dictionary for configuring dashboard layout using gridspec
             For information about Gridspec configuration, refer to `Matplotlib documentation <https://matplotlib.org/3.5.0/api/_as_gen/matplotlib.gridspec.GridSpec.html#matplotlib.gridspec.GridSpec>_. The default is None.
 
+        psd_cache : MultiplePSD, optional
+            Previously computed spectra to reuse for the power spectrum panel, skipping
+            the spectral analysis entirely. If None, the spectra are computed once and
+            cached on the object, so repeated dashboard calls with identical
+            spectral_kwargs (e.g. while tweaking the layout) do not re-run the estimation.
+            The default is None.
+
+        preprocess : bool, optional
+            Whether to detrend and standardize the ensemble before spectral analysis.
+            Set to False when the members are already z-scored (e.g. after upstream
+            quality control), which skips two full passes over the data.
+            The default is True.
+
         savefig_settings : dict, optional
             the dictionary of arguments for plt.savefig(); some notes below:
             - "path" must be specified; it can be any existed or non-existed path,
@@ -611,6 +637,10 @@ class EnsembleGeoSeries(EnsembleSeries):
             fig, ax = ts_interp.dashboard()
 
         '''
+        # defer the matplotlib imports so that merely importing the class stays light
+        import matplotlib.pyplot as plt
+        import matplotlib.gridspec as gridspec
+
         savefig_settings = {} if savefig_settings is None else savefig_settings.copy()
         # start plotting
         fig = plt.figure(figsize=figsize)
@@ -630,10 +660,8 @@ class EnsembleGeoSeries(EnsembleSeries):
         # use the defaults if color/markers not specified
         
         if self.archiveType is not None:
-            archiveType = lipdutils.LipdToOntology(self.archiveType)
-            if archiveType not in lipdutils.PLOT_DEFAULT.keys():
-                archiveType = 'Other'                
-        else: 
+            archiveType = _resolve_archive(self.archiveType)
+        else:
             if not all([isinstance(ts, GeoSeries) for ts in self.series_list]):
                 archiveType = 'Other'
             else:
@@ -644,13 +672,14 @@ class EnsembleGeoSeries(EnsembleSeries):
                 #If they aren't, pick the most common one
                 else:
                     archiveType = Counter(archiveList).most_common(1)[0][0]
-        # if 'marker' not in plt_kwargs.keys():
-        #     plt_kwargs.update({'marker': lipdutils.PLOT_DEFAULT[archiveType][1]})
-        if 'curve_clr' not in plt_kwargs.keys():
-            plt_kwargs.update({'curve_clr': lipdutils.PLOT_DEFAULT[archiveType][0]})
-        if 'shade_clr' not in plt_kwargs.keys():
-            plt_kwargs.update({'shade_clr': lipdutils.PLOT_DEFAULT[archiveType][0]})
-        ax['ts'] = self.common_time().plot_envelope(**plt_kwargs)
+                archiveType = _resolve_archive(archiveType)
+        _default_color = lipdutils.PLOT_DEFAULT[archiveType][0]
+        # plt_kwargs.setdefault('marker', lipdutils.PLOT_DEFAULT[archiveType][1])
+        plt_kwargs.setdefault('curve_clr', _default_color)
+        plt_kwargs.setdefault('shade_clr', _default_color)
+        # align the time axes once; the spectral panel reuses this result below
+        ct = self.common_time()
+        ax['ts'] = ct.plot_envelope(**plt_kwargs)
         
         ymin, ymax = ax['ts'].get_ylim()
 
@@ -661,8 +690,7 @@ class EnsembleGeoSeries(EnsembleSeries):
         histplt_kwargs.update({'ylabel': 'Counts'})
         histplt_kwargs.update({'vertical': True})
 
-        if 'color' not in histplt_kwargs.keys():            
-            histplt_kwargs.update({'color': lipdutils.PLOT_DEFAULT[archiveType][0]})
+        histplt_kwargs.setdefault('color', _default_color)
 
         ax['dts'] = self.histplot(**histplt_kwargs)
         ax['dts'].set_ylim([ymin, ymax])
@@ -718,17 +746,30 @@ class EnsembleGeoSeries(EnsembleSeries):
         spectralfig_kwargs.update({'ax': ax['spec']})
 
         
-        ts_preprocess = self.detrend().standardize().common_time()
-        psds = ts_preprocess.spectral(**spectral_kwargs)
-        #Avoid excessive legend labels in spectral plot
-        for psd in psds.psd_list:
-            psd.label = None
+        if psd_cache is not None:
+            psds = psd_cache
+        else:
+            # spectral estimation dominates dashboard runtime, so keep the result
+            # around for repeated renders with the same settings
+            cache_key = (preprocess, repr(sorted(spectral_kwargs.items())))
+            cached = getattr(self, '_psd_cache', None)
+            if cached is not None and cached[0] == cache_key:
+                psds = cached[1]
+            else:
+                # detrend/standardize operate pointwise and preserve the time grid,
+                # so the common-time ensemble from above can be reused without re-interpolating
+                ts_preprocess = ct.detrend().standardize() if preprocess else ct
+                psds = ts_preprocess.spectral(**spectral_kwargs)
+                self._psd_cache = (cache_key, psds)
+        #Avoid excessive legend labels in spectral plot; cached/pre-cleared PSDs
+        #skip the rewrite loop entirely
+        if len(psds.psd_list) > 0 and psds.psd_list[0].label is not None:
+            for psd in psds.psd_list:
+                psd.label = None
 
         # plot
-        if 'curve_clr' not in spectralfig_kwargs.keys():
-            spectralfig_kwargs.update({'curve_clr': lipdutils.PLOT_DEFAULT[archiveType][0]})
-        if 'shade)clr' not in spectralfig_kwargs.keys():
-            spectralfig_kwargs.update({'shade_clr': lipdutils.PLOT_DEFAULT[archiveType][0]})
+        spectralfig_kwargs.setdefault('curve_clr', _default_color)
+        spectralfig_kwargs.setdefault('shade_clr', _default_color)
         ax['spec'] = psds.plot_envelope(**spectralfig_kwargs)
 
         if 'path' in savefig_settings:
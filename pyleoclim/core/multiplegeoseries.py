@@ -9,20 +9,7 @@ from ..utils import mapping as mp
 from ..utils import plotting
 
 
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-#from matplotlib import cm
-#from itertools import cycle
-#import matplotlib.lines as mlines
 import numpy as np
-#import warnings
-
-#import matplotlib.pyplot as plt
-#import matplotlib as mpl
-#from matplotlib import cm
-#from itertools import cycle
-#import matplotlib.lines as mlines
-#import copy
 
 
 class MultipleGeoSeries(MultipleSeries):
@@ -619,6 +606,10 @@ class MultipleGeoSeries(MultipleSeries):
             ms.time_geo_plot()
 
         '''
+        # defer the matplotlib imports so that merely importing the class stays light
+        import matplotlib.pyplot as plt
+        import matplotlib as mpl
+
         savefig_settings = {} if savefig_settings is None else savefig_settings.copy()
         plot_kwargs = {} if plot_kwargs is None else plot_kwargs.copy()
         lgd_kwargs = {} if lgd_kwargs is None else lgd_kwargs.copy()
@@ -10,9 +10,38 @@ from ..utils import tsutils, tsmodel
 
 import numpy as np
 import warnings
+import copy
+from collections import namedtuple
+from functools import lru_cache
 
 supported_surrogates = frozenset(['ar1sim','phaseran','uar1','CN']) # broadcast all supported surrogates as global variable, for exception handling
 
+# per-method constants, resolved once at import instead of per instantiation/call
+_KernelSpec = namedtuple('_KernelSpec', ['name', 'default_label', 'nparam'])
+
+_SPECS = {'ar1sim': _KernelSpec('ar1sim', "AR(1) surrogates (MoM)", 2),
+          'phaseran': _KernelSpec('phaseran', "Phase-randomized surrogates", 0),
+          'uar1': _KernelSpec('uar1', "AR(1) surrogates (MLE)", 2),
+          'CN': _KernelSpec('CN', r'Power-law surrogates ($S(f) \propto f^{-\beta}$)', 1)}
+
+
+@lru_cache(maxsize=128)
+def _seed_sequence(seed):
+    return np.random.SeedSequence(seed)
+
+def _get_rng(seed):
+    ''' Return a Generator initialized at the start of the stream for `seed`.
+
+    The SeedSequence is cached so repeated seeded constructions (e.g. in outer
+    Monte Carlo loops) skip the entropy hashing; only the cheap bit-generator
+    wrapper is rebuilt. The Generator itself is deliberately not cached, since
+    reusing one would advance its state across calls and silently break the
+    reproducibility of same-seed constructions.
+    '''
+    if seed is None:
+        return None
+    return np.random.Generator(np.random.PCG64(_seed_sequence(seed)))
+
 class SurrogateSeries(EnsembleSeries):
     ''' Object containing surrogate timeseries, obtained either by emulating an 
     existing series (see `from_series()`) or from a parametric model (see `from_param()`)
@@ -64,28 +93,24 @@ class SurrogateSeries(EnsembleSeries):
         self.param = param
         self.number = number
         self.seed = seed
-        
+
+        # validate the method once, whether or not a label is provided
+        spec = _SPECS.get(method)
+        if spec is None:
+            raise ValueError(f"Unknown method: {self.method}. Please use one of {supported_surrogates}")
+        self._spec = spec
+
         if param is not None:
             nparam = len(param)
-            if 'ar1' in method and nparam !=2:
-                raise ValueError("2 parameters are needed for this model")
-            elif method == 'phaseran':
+            if spec.name == 'phaseran':
                 warnings.warn("Phase-randomization is a non parametric method; the provided parameters will be ignored")
-            elif method == 'CN' and nparam >1:
+            elif spec.nparam == 2 and nparam != 2:
+                raise ValueError("2 parameters are needed for this model")
+            elif spec.name == 'CN' and nparam >1:
                 raise ValueError(f"1 parameter is needed for this model; only the first of the provided {nparam} will be used")
-       
+
         # refine the display name
-        if label is None:
-            if method == 'ar1sim':
-                self.label =  "AR(1) surrogates (MoM)"
-            elif method == 'phaseran':
-                self.label = "Phase-randomized surrogates"
-            elif method == 'uar1':
-                self.label = "AR(1) surrogates (MLE)"
-            elif method == 'CN':
-                self.label = r'Power-law surrogates ($S(f) \propto f^{-\beta}$)'
-            else:
-                raise ValueError(f"Unknown method: {self.method}. Please use one of {supported_surrogates}")
+        self.label = label if label is not None else spec.default_label
                 
     def from_series(self, target_series):
         '''
@@ -129,18 +154,19 @@ class SurrogateSeries(EnsembleSeries):
         if not isinstance(target_series, Series):
             raise TypeError(f"Expected pyleo.Series, got: {type(target_series)}")
             
-        if self.seed is not None:
-            np.random.default_rng(self.seed)
-        
+        # a seeded Generator is threaded through the simulators; the previous code
+        # built one and discarded it, leaving the draws unseeded
+        rng = _get_rng(self.seed)
+
         # apply surrogate method
         if self.method == 'ar1sim':
             tsi = target_series if target_series.is_evenly_spaced() else target_series.interp()
             mu = tsi.value.mean()
-            y_surr = tsmodel.ar1_sim(target_series.value, self.number, target_series.time) + mu  
+            y_surr = tsmodel.ar1_sim(target_series.value, self.number, target_series.time, rng=rng) + mu
 
         elif self.method == 'phaseran':
             if target_series.is_evenly_spaced():
-                y_surr = tsutils.phaseran2(target_series.value, self.number)
+                y_surr = tsutils.phaseran2(target_series.value, self.number, rng=rng)
             else:
                 raise ValueError("Phase-randomization presently requires evenly-spaced series.")
 
@@ -150,36 +176,80 @@ class SurrogateSeries(EnsembleSeries):
             tsi = target_series if target_series.is_evenly_spaced() else target_series.interp()
             mu = tsi.value.mean()
             self.param = [tau, sigma_2] # assign parameters for future use
-            # generate time axes according to provided pattern
-            times = np.squeeze(np.tile(target_series.time, (self.number, 1)).T)  
-            # generate matrix and add  the mean
-            y_surr = tsmodel.uar1_sim(t = times, tau=tau, sigma_2=sigma_2) + mu
-            
+            # generate matrix on the shared time axis and add the mean
+            y_surr = tsmodel.uar1_sim(t = target_series.time, tau=tau, sigma_2=sigma_2,
+                                      number=self.number, rng=rng) + mu
+
         elif self.method == 'CN':
             tsi = target_series if target_series.is_evenly_spaced() else target_series.interp()
             mu = tsi.value.mean()
             sigma = tsi.value.std()
             alpha = tsi.spectral(method='cwt').beta_est().beta_est_res['beta'] # fit the parameter using the smoothest spectral method
             self.param = [alpha]
-            y_surr = np.empty((len(target_series.time),self.number))
+            y_surr = np.empty((len(target_series.time),self.number), order='F') # contiguous columns
             for i in range(self.number):
-                y_surr[:,i] = tsmodel.colored_noise(alpha=alpha,t=target_series.time, std = sigma) + mu
+                y_surr[:,i] = tsmodel.colored_noise(alpha=alpha,t=target_series.time, std = sigma, rng=rng) + mu
         
-        if self.number > 1:
-            s_list = []
-            for i, y in enumerate(y_surr.T):
-                ts = target_series.copy() # copy Series
-                ts.value = y 
-                ts.label = str(target_series.label or '') + " #" + str(i+1)
-                s_list.append(ts)
-        else:
-            ts = target_series.copy() # copy Series
-            ts.value = np.squeeze(y_surr)
-            ts.label = str(target_series.label or '') 
-            s_list = [ts]
+        # normalize to an (n, number) matrix so a single materialization path serves all cases
+        y_surr = np.asarray(y_surr)
+        if y_surr.ndim == 1:
+            y_surr = y_surr[:, np.newaxis]
+
+        proto = target_series.copy() # deep-copy the Series once; surrogates only rebind value and label
+        base = str(target_series.label or '')
+        labels = [f"{base} #{i+1}" for i in range(self.number)] if self.number > 1 else [base]
+        s_list = []
+        for i in range(self.number):
+            ts = copy.copy(proto)
+            ts.value = y_surr[:, i]
+            ts.label = labels[i]
+            s_list.append(ts)
 
         self.series_list = s_list
                   
+    def from_matrix(self, time, values):
+        '''
+        Populate the series_list from a shared time axis and a matrix of realizations
+
+        This is the cheap bulk-construction path: the matrix is stored as-is and
+        each Series holds a zero-copy view of its column (pass an F-contiguous
+        matrix for contiguous columns), with the time axis shared by reference.
+        Only one Series is fully constructed; the others are shallow copies of it.
+
+        Parameters
+        ----------
+        time : array, length n
+            Time axis common to all realizations. Expected to be sorted and free
+            of NaNs, since it only passes through Series validation once.
+
+        values : array, shape (n, number)
+            One realization per column.
+
+        See also
+        --------
+
+        pyleoclim.core.series.Series : the basic time series object
+
+        '''
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        p = values.shape[1]
+        self.number = p
+
+        base = str(self.label or '')
+        labels = [f"{base} #{i+1}" for i in range(p)] if p > 1 else [base]
+        proto = Series(time=time, value=values[:, 0], label=labels[0],
+                       verbose=False, auto_time_params=True)
+        s_list = [proto]
+        for i in range(1, p):
+            ts = copy.copy(proto)
+            ts.value = values[:, i]
+            ts.label = labels[i]
+            s_list.append(ts)
+
+        self.series_list = s_list
+
     def from_param(self, param, length=50, time_pattern = 'even', settings=None):
         '''
         Simulate the SurrogateSeries from a parametric model
@@ -239,57 +309,72 @@ class SurrogateSeries(EnsembleSeries):
             np.random.seed(self.seed)
         
         # generate time axes according to provided pattern
+        # for shared axes, `times` is a read-only broadcast view: the 1D axis is
+        # stored once rather than copied into number identical columns
         if time_pattern == "even":
-            delta_t = settings["delta_t"] if "delta_t" in settings else 1.0
-            t = np.cumsum([float(delta_t)]*length)
-            times = np.tile(t, (self.number, 1)).T     
+            delta_t = settings.get("delta_t", 1.0)
+            t = np.arange(1, length + 1, dtype=np.float64) * float(delta_t)
+            times = np.broadcast_to(t[:, np.newaxis], (length, self.number))
         elif time_pattern == "random":
-            times = np.zeros((length, self.number))
-            for i in range(self.number):
-                dist_name = settings['delta_t_dist'] if "delta_t_dist" in settings else "exponential"
-                dist_param = settings['param'] if "param" in settings else [1]
-                times[:, i] = tsmodel.random_time_axis(length, dist_name,dist_param) 
+            dist_name = settings.get("delta_t_dist", "exponential")
+            dist_param = settings.get("param", [1])
+            times = tsmodel.random_time_axis(length, dist_name, dist_param, number=self.number)
         elif time_pattern == 'specified':
             if "time" not in settings:
                 raise ValueError("'time' not found in settings")
             else:
                 if self.number > 1:
-                    times =  np.tile(settings["time"], (self.number, 1)).T 
+                    t = np.asarray(settings["time"])
+                    times = np.broadcast_to(t[:, np.newaxis], (len(t), self.number))
                 else:
                     times = settings["time"]
         else:
             raise ValueError(f"Unknown time pattern: {time_pattern}")
          
         # apply surrogate method
-        y_surr = np.empty_like(times)                 
-        
         if self.method in ['uar1','ar1sim']: # AR(1) models
             if nparam != 2:
                 warnings.warn(f'The AR(1) model needs 2 parameters, tau and sigma2 (in that order); {nparam} provided. default values used, tau=5, sigma=0.5',UserWarning, stacklevel=2)
                 param = [5,0.5]
-            y_surr = tsmodel.uar1_sim(t = times, tau=param[0], sigma_2=param[1])
+            if time_pattern == "random": # one time axis per realization
+                y_surr = tsmodel.uar1_sim(t = times, tau=param[0], sigma_2=param[1])
+            else: # all realizations share the same time axis
+                t1d = times[:, 0] if times.ndim == 2 else times
+                y_surr = tsmodel.uar1_sim(t = t1d, tau=param[0], sigma_2=param[1], number=self.number)
             
         elif self.method == 'CN': # colored noise
             if nparam >1:
                 raise ValueError(f"1 parameter is needed for this model; only the first of the provided {nparam} will be used")
-            y_surr = np.empty((length,self.number))
+            y_surr = np.empty((length,self.number), order='F') # contiguous columns
             if self.number > 1:
                 for i in range(self.number):
                     y_surr[:,i] = tsmodel.colored_noise(alpha=param[0],t=times[:,i])
             else:
                 y_surr = tsmodel.colored_noise(alpha=param[0],t=times)
                  
-        elif self.method == 'phaseran':  
+        elif self.method == 'phaseran':
             raise ValueError("Phase-randomization is only available in from_series().")
-        
-        # create the series_list    
+
+        else: # unreachable after __init__ validation; defensive guard for subclasses or a monkey-patched method
+            raise ValueError(f"Unknown method: {self.method}. Please use one of {supported_surrogates}")
+
+        # create the series_list
         s_list = []
         if self.number > 1:
-            for i, (t, y) in enumerate(zip(times.T,y_surr.T)):
-                ts = Series(time=t, value=y,  
-                               label = str(self.label or '') + " #" + str(i+1),
-                               verbose=False, auto_time_params=True)
-                s_list.append(ts)
+            base = str(self.label or '')
+            labels = [f"{base} #{i+1}" for i in range(self.number)]
+            if time_pattern == "random": # distinct time axes: one Series per column, with time metadata
+                # resolved once (the values auto_time_params would infer) instead of per realization
+                for i, (t, y) in enumerate(zip(times.T,y_surr.T)):
+                    ts = Series(time=t, value=y,
+                                   label = labels[i],
+                                   time_name='Time', time_unit='years CE',
+                                   verbose=False, auto_time_params=False)
+                    s_list.append(ts)
+            else: # shared time axis: delegate to the bulk-construction path
+                t1d = times[:, 0] if times.ndim == 2 else times
+                self.from_matrix(t1d, y_surr)
+                s_list = self.series_list
         else:
             ts = Series(time=np.squeeze(times), value=np.squeeze(y_surr),  
                         label = str(self.label or '') + " #`",
@@ -30,8 +30,23 @@ class TestSurrogateSeriesFromSeries:
         surr = pyleo.SurrogateSeries(method=method,number=number,seed=seed)
         surr.from_series(target_series=series)
 
-    @pytest.mark.parametrize('method',['ar1sim','uar1','phaseran','CN'])          
-    @pytest.mark.parametrize('number',[1,5])     
+    @pytest.mark.parametrize('method',['ar1sim','uar1','phaseran','CN'])
+    def test_from_series_seed(self, gen_ts, method, number=3, seed=42):
+        ''' Test that a seed makes from_series reproducible: two same-seed
+            constructions yield identical surrogates, while distinct members
+            of one ensemble stay distinct
+        '''
+        surr1 = pyleo.SurrogateSeries(method=method, number=number, seed=seed)
+        surr1.from_series(gen_ts)
+        surr2 = pyleo.SurrogateSeries(method=method, number=number, seed=seed)
+        surr2.from_series(gen_ts)
+        for s1, s2 in zip(surr1.series_list, surr2.series_list):
+            assert_array_equal(s1.value, s2.value) # same seed, same draws
+        assert not np.array_equal(surr1.series_list[0].value,
+                                  surr1.series_list[1].value) # members differ
+
+    @pytest.mark.parametrize('method',['ar1sim','uar1','phaseran','CN'])
+    @pytest.mark.parametrize('number',[1,5])
     def test_from_series_match(self, method, number):
         ''' Test that from_series() works with all methods, matches the original
             time axis AND that number can be varied
@@ -44,6 +59,36 @@ class TestSurrogateSeriesFromSeries:
         for s in surr.series_list:
             assert_array_equal(s.time, ts.time) # test time axis match
 
+class TestSurrogateSeriesFromMatrix:
+    '''Tests for SurrogateSeries.from_matrix() method'''
+    def test_from_matrix_t0(self, n=30, number=4):
+        ''' Test that a (n, number) matrix yields number members sharing the
+            time axis, with column views as values and numbered labels
+        '''
+        t = np.arange(1., n+1)
+        values = np.asfortranarray(np.random.randn(n, number))
+        surr = pyleo.SurrogateSeries(method='uar1', number=1)
+        surr.from_matrix(t, values)
+        assert surr.number == number # number follows the matrix width
+        assert len(surr.series_list) == number
+        for i, ts in enumerate(surr.series_list):
+            assert_array_equal(ts.time, t)
+            assert_array_equal(ts.value, values[:, i])
+            assert ts.label.endswith(f"#{i+1}")
+
+    def test_from_matrix_t1(self, n=30):
+        ''' Test that 1D values produce a single member with the unsuffixed label
+        '''
+        t = np.arange(1., n+1)
+        values = np.random.randn(n)
+        surr = pyleo.SurrogateSeries(method='uar1', number=5)
+        surr.from_matrix(t, values)
+        assert surr.number == 1
+        assert len(surr.series_list) == 1
+        assert surr.series_list[0].label == surr.label
+        assert_array_equal(surr.series_list[0].value, values)
+
+
 class TestSurrogateSeriesFromParam:
     '''Tests for SurrogateSeries.from_param() method'''
     @pytest.mark.parametrize('method, noise_param', [('uar1',[1,5]),
@@ -34,6 +34,16 @@ def test_time_index_2():
     delta_t = tsmodel.random_time_axis(n=20, delta_t_dist = "random_choice",
                                         param=[[1,2],[.95,.05]] )
     assert all(np.cumsum(delta_t)>0)
+
+@pytest.mark.parametrize('model', ["exponential", "poisson"])
+def test_time_index_3(model, n=20, number=5):
+    '''
+    Generate several time axes in one batched draw
+    '''
+    t = tsmodel.random_time_axis(n=n, param=[1], delta_t_dist = model, number=number)
+    assert t.shape == (n, number)
+    for j in range(number):
+        assert all(np.diff(t[:, j]) > 0) # each column is a valid (increasing) axis
     
 @pytest.mark.parametrize(('p', 'evenly_spaced'), [(1, True), (10, True), (1, False), (10, False)])
 def test_uar1_fit(p, evenly_spaced, tol = 0.45):
@@ -68,6 +78,19 @@ def test_uar1_fit(p, evenly_spaced, tol = 0.45):
     assert np.abs(theta_hat_bar[0]-tau) < tol
     assert np.abs(theta_hat_bar[1]-sigma_2) < tol
     
+@pytest.mark.parametrize('number',[1,10])
+def test_uar1_sim_number(number, n=200):
+    '''
+    Simulate several realizations on a shared 1D time axis via the number kwarg
+    '''
+    t = np.arange(1, n+1, dtype=float)
+    ys = tsmodel.uar1_sim(t=t, tau=2, sigma_2=1, number=number)
+    if number == 1:
+        assert ys.shape == (n,) # superfluous dimensions squeezed, as with a 1D axis alone
+    else:
+        assert ys.shape == (n, number)
+        assert not np.array_equal(ys[:, 0], ys[:, 1]) # realizations differ
+
 @pytest.mark.parametrize('std',[None,2])
 def test_colored_noise(std, nt=100, eps = 0.1):
     t = np.arange(nt)
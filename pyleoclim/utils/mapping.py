@@ -13,7 +13,6 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 import copy
-from itertools import cycle
 # matplotlib imports
 import matplotlib.pyplot as plt
 from matplotlib.lines import Line2D
@@ -94,7 +93,7 @@ def set_proj(projection='Robinson', proj_default=True):
     pyleoclim.utils.mapping.map : mapping function making use of the projection
 
     """
-    if proj_default is not True and type(proj_default) is not dict:
+    if proj_default is not True and not isinstance(proj_default, dict):
         raise TypeError('The default for the projections should either be provided' +
                         ' as a dictionary or set to True')
 
@@ -394,7 +393,7 @@ def map(lat, lon, criteria, marker=None, color=None,
                          "length")
 
     # Check that the default is set to True or in dictionary format
-    if proj_default is not True and type(proj_default) is not dict:
+    if proj_default is not True and not isinstance(proj_default, dict):
         raise TypeError('The default for the projections should either be provided' +
                         ' as a dictionary or set to True')
 
@@ -407,25 +406,25 @@ def map(lat, lon, criteria, marker=None, color=None,
         if 'marker' in scatter_kwargs.keys():
             print('marker has been set as a parameter to the map_all function, overriding scatter_kwargs')
             del scatter_kwargs['marker']
-        if type(marker) == list and len(marker) != len(criteria):
+        if isinstance(marker, list) and len(marker) != len(criteria):
             raise ValueError('The marker vector should have the same length as the lat/lon/criteria vector')
 
     if color is not None:
         if 'facecolor' in scatter_kwargs.keys():
             print('facecolor has been set as a parameter to the map_all function, overriding scatter_kwargs')
             del scatter_kwargs['facecolor']
-        if type(color) == list and len(color) != len(criteria):
+        if isinstance(color, list) and len(color) != len(criteria):
             raise ValueError('The color vector should have the same length as the lon/lat/criteria vector')
 
     # Prepare scatter information
     if 's' in scatter_kwargs.keys():
-        if type(scatter_kwargs['s']) == list and len(scatter_kwargs['s']) != len(criteria):
+        if isinstance(scatter_kwargs['s'], list) and len(scatter_kwargs['s']) != len(criteria):
             raise ValueError('If s is a list, it should have the same length as lon/lat/criteria')
     else:
         scatter_kwargs['s'] = None
 
     if 'edgecolors' in scatter_kwargs.keys():
-        if type(scatter_kwargs['edgecolors']) == list and len(scatter_kwargs['edgecolors']) != len(criteria):
+        if isinstance(scatter_kwargs['edgecolors'], list) and len(scatter_kwargs['edgecolors']) != len(criteria):
             raise ValueError('If edgecolors is a list, it should have the same length as lon/lat/criteria')
     else:
         scatter_kwargs['edgecolors'] = None
@@ -518,44 +517,59 @@ def map(lat, lon, criteria, marker=None, color=None,
         return ax
 
 
+def _is_numeric_col(col):
+    '''Numeric check for a trait column.
+
+    A numeric dtype answers in O(1); only object columns (which may mix
+    numbers with the missing-value label) need the per-element scan.
+    '''
+    if pd.api.types.is_numeric_dtype(col):
+        return True
+    return all(isinstance(i, (int, float)) for i in col)
+
+
 def make_df(geo_ms, hue=None, marker=None, size=None, cols=None, d=None):
     try:
         geo_series_list = geo_ms.series_list
     except:
         geo_series_list = [geo_ms]
 
-    lats = [geos.lat for geos in geo_series_list]
-    lons = [geos.lon for geos in geo_series_list]
+    # extract both coordinates in a single pass, yielding contiguous float buffers
+    # (a generator expression, since the builtin map is shadowed by mapping.map here)
+    coords = np.fromiter(((geos.lat, geos.lon) for geos in geo_series_list),
+                         dtype=[('lat', 'f8'), ('lon', 'f8')], count=len(geo_series_list))
 
     traits = [hue, marker, size]
-    if type(cols) == list:
+    if isinstance(cols, list):
         traits += cols
-    value_d = {'lat': lats, 'lon': lons}
+    value_d = {'lat': coords['lat'], 'lon': coords['lon']}
 
     for trait in traits:  # trait_d.keys():
         # trait = trait_d[trait_key]
         if trait != None:
+            # single pass over the collection; getattr goes through the descriptor
+            # protocol once per series, picking up inherited attributes that a
+            # __dict__ probe would miss, and the 'None'-string normalization is
+            # fused into the same traversal
+            trait_vals = np.fromiter((val if val != 'None' else None
+                                      for val in (getattr(geos, trait, None) for geos in geo_series_list)),
+                                     dtype=object, count=len(geo_series_list))
             if trait == 'archiveType':
-                trait_vals = []
-                for geos in geo_series_list:
-                    if trait in geos.__dict__.keys():
-                        try:
-                            trait_vals.append(LipdToOntology(geos.__dict__[trait]).lower().replace(" ", ""))
-                        except:
-                            trait_vals.append(None)
-                    else:
-                        trait_vals.append(None)
-                # trait_vals = [LipdToOntology(geos.__dict__[trait]).lower().replace(" ","") if trait in geos.__dict__.keys() else None for geos in
-                #          geo_series_list]
-            else:
-                trait_vals = [geos.__dict__[trait] if trait in geos.__dict__.keys() else None for geos in
-                              geo_series_list]
-            value_d[trait] = [trait_val if trait_val != 'None' else None for trait_val in trait_vals]
+                for ik, val in enumerate(trait_vals):
+                    if val is None:
+                        continue
+                    try:
+                        trait_vals[ik] = LipdToOntology(val).lower().replace(" ", "")
+                    except:
+                        trait_vals[ik] = None
+            # hand pandas a list so its usual dtype inference applies (e.g. a
+            # numeric trait with missing entries becomes float64 with NaN)
+            value_d[trait] = trait_vals.tolist()
 
     geos_df = pd.DataFrame(value_d)
-    if type(d) == dict:
+    if isinstance(d, dict):
         for trait in d.keys():
-            if type(d[trait]) in [list, np.ndarray]:
+            if isinstance(d[trait], (list, np.ndarray)):
                 if len(d[trait]) == len(geos_df):
                     geos_df[trait] = d[trait]
 
@@ -708,7 +722,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
     #
     #     trait_d = {'hue': hue, 'marker': marker, 'size': size}
     #     traits = [hue, marker, size]
-    #     if type(cols) == list:
+    #     if isinstance(cols, list):
     #         traits += cols
     #     value_d = {'lat': lats, 'lon': lons}
     #     for trait in traits:#trait_d.keys():
@@ -726,9 +740,9 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                      cmap=None, **kwargs):
 
         # ensure these are dictionaries if not specified in the function call
-        scatter_kwargs = {} if type(scatter_kwargs) != dict else scatter_kwargs
-        lgd_kwargs = {} if type(lgd_kwargs) != dict else lgd_kwargs
-        kwargs = {} if type(kwargs) != dict else kwargs
+        scatter_kwargs = {} if not isinstance(scatter_kwargs, dict) else scatter_kwargs
+        lgd_kwargs = {} if not isinstance(lgd_kwargs, dict) else lgd_kwargs
+        kwargs = {} if not isinstance(kwargs, dict) else kwargs
 
         # color mapping specs
         norm_kwargs = kwargs.pop('norm_kwargs', {})
@@ -748,7 +762,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
             _df = _df.reindex()
 
         ax_leg, ax_cb = None, None
-        if type(ax_d) == dict:
+        if isinstance(ax_d, dict):
             if 'map' in ax_d.keys():
                 ax = ax_d['map']
             if 'cb' in ax_d.keys():
@@ -763,10 +777,10 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
 
         transform = ccrs.PlateCarree()
 
-        missing_d = {'hue': kwargs['missing_val_hue'] if 'missing_val_hue' in kwargs else 'k',
-                     'marker': kwargs['missing_val_marker'] if 'missing_val_marker' in kwargs else r'$?$',
-                     'size': kwargs['missing_val_size'] if 'missing_val_size' in kwargs else 200,
-                     'label': kwargs['missing_val_label'] if 'missing_val_label' in kwargs else 'missing',
+        missing_d = {'hue': kwargs.get('missing_val_hue', 'k'),
+                     'marker': kwargs.get('missing_val_marker', r'$?$'),
+                     'size': kwargs.get('missing_val_size', 200),
+                     'label': kwargs.get('missing_val_label', 'missing'),
                      }
         missing_val = missing_d['label']
 
@@ -799,7 +813,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
         hue_var = hue_var if hue_var in _df.columns else None
         hue_var_type_numeric = False
         if hue_var is not None:
-            hue_var_type_numeric = all(isinstance(i, (int, float)) for i in _df[_df[hue_var] != missing_val][
+            hue_var_type_numeric = _is_numeric_col(_df[_df[hue_var] != missing_val][
                 hue_var])  # pd.to_numeric(_df[hue_var], errors='coerce').notnull().all()
         if hue_var_type_numeric is False:
             colorbar = False
@@ -812,7 +826,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
         size_var = size_var if size_var in _df.columns else None
         size_var_type_numeric = False
         if size_var is not None:
-            size_var_type_numeric = all(isinstance(i, (int, float)) for i in _df[_df[size_var] != missing_val][
+            size_var_type_numeric = _is_numeric_col(_df[_df[size_var] != missing_val][
                 size_var])  # pd.to_numeric(_df[size_var], errors='coerce').notnull().all()
 
         # if maker is None, and colorbar is True, legend should be False
@@ -824,7 +838,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                       ((trait_var != None) and (trait_var in _df.columns))]
 
         for trait_var in trait_vars:
-            if type(_df[trait_var]) == pd.Series:
+            if isinstance(_df[trait_var], pd.Series):
                 _df[trait_var] = _df[trait_var].fillna(missing_val)
             else:
                 if _df[trait_var] in [None, 'None']:
@@ -833,8 +847,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
         if size_var is None:
             scatter_kwargs['s'] = scatter_kwargs['s'] if 's' in scatter_kwargs else missing_d['size']
         else:
-            sizes = [size_val for size_val in _df[size_var].values if size_val != missing_val]
-            if len(sizes) < 2:
+            if (_df[size_var] != missing_val).sum() < 2:
                 scatter_kwargs['s'] = scatter_kwargs['s'] if 's' in scatter_kwargs else missing_d['size']
                 size_var = None
             else:
@@ -855,13 +868,11 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                                 marker not in ['.', '', ' ', 'none', 'None']]
 
         # check if a mapping has been prescribed
-        trait2marker = None
-        if 'marker_mapping' in kwargs:
-            trait2marker = kwargs['marker_mapping']
-        elif marker_var == 'archiveType':
+        trait2marker = kwargs.get('marker_mapping')
+        if trait2marker is None and marker_var == 'archiveType':
             trait2marker = {key: value[1] for key, value in plot_defaults.items()}
 
-        if type(trait2marker) == dict:
+        if isinstance(trait2marker, dict):
             residual_traits = [trait for trait in _df[marker_var].unique() if
                                trait not in trait2marker.keys()]  # +set(['missing'])
             residual_markers = [marker for marker in marker_selection if marker not in trait2marker.values()]
@@ -869,7 +880,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                 trait2marker[trait] = residual_markers.pop()
 
             for key in trait2marker:
-                if type(trait2marker[key]) == str:
+                if isinstance(trait2marker[key], str):
                     if trait2marker[key] == missing_d['marker']:
                         print('default symbol for missing values used in mapping')
                     try:
@@ -877,13 +888,13 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                     except:
                         pass
 
-        m_cycle = cycle(marker_selection)
-        if ((marker_var != None) and (type(trait2marker) != dict)):
-            if len(_df[marker_var].unique()) > 1:
-                trait2marker = {trait_val: next(m_cycle) for ik, trait_val
-                                in enumerate(_df[marker_var].unique())}
+        if ((marker_var is not None) and not isinstance(trait2marker, dict)):
+            marker_traits = _df[marker_var].unique()
+            if len(marker_traits) > 1:
+                trait2marker = {trait_val: marker_selection[ik % len(marker_selection)]
+                                for ik, trait_val in enumerate(marker_traits)}
 
-        if ((type(marker_var) == str) and (type(trait2marker) == dict)):
+        if (isinstance(marker_var, str) and isinstance(trait2marker, dict)):
             # with missing values assigned '?'
             trait2marker['missing'] = missing_d['marker']
             scatter_kwargs['markers'] = trait2marker
@@ -893,12 +904,11 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                 print(residual_traits)
 
         # use hue mapping if supplied
-        if 'hue_mapping' in kwargs:
-            palette = kwargs.pop('hue_mapping', None)
+        palette = kwargs.pop('hue_mapping', None)
         # there should be different control for discrete and continuous hue
-        elif hue_var == 'archiveType':
+        if palette is None and hue_var == 'archiveType':
             palette = {key: value[0] for key, value in plot_defaults.items()}
-        elif isinstance(hue_var,str): #hue_var) == str:
+        elif palette is None and isinstance(hue_var,str): #hue_var) == str:
             hue_data = _df[_df[hue_var] != missing_val]
             # If scalar mappable was passed, try to extract components.
             if ax_sm is not None:
@@ -927,7 +937,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                                                          norm_kwargs=norm_kwargs)
                             palette = ax_sm.cmap
                     else:
-                        if ((type(palette) in [str, list]) or (palette is None)):
+                        if (isinstance(palette, (str, list)) or (palette is None)):
                             if color_scale_type == 'discrete':
                                 n = max(10, int(np.ceil(np.sqrt(len(hue_data[hue_var].unique())))))
                                 ax_sm = make_scalar_mappable(cmap=palette, hue_vect=hue_data[hue_var], n=n,
@@ -938,7 +948,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                             palette = ax_sm.cmap
                             hue_norm = ax_sm.norm  # .autoscale(hue_data[hue_var])
 
-        if ((type(hue_var) == str) and (type(palette) == dict)):
+        if (isinstance(hue_var, str) and isinstance(palette, dict)):
             residual_traits = [trait for trait in _df[hue_var].unique() if
                                trait not in palette.keys()]
 
@@ -948,7 +958,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
         # to get missing hue values to be missing value color (contrary to palette for available values)
         # we plot all data with missing color, collect legend information,
         # then plot data with available hue over it, collect the legend information again and recompose the legend
-        if type(hue_var) == str:
+        if isinstance(hue_var, str):
             scatter_kwargs['zorder'] = 13
             if isinstance(edgecolor, np.ndarray):
                 _df['edgecolor'] = edgecolor
@@ -1046,9 +1056,9 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
         # if legend is True, prep legend content
         d_leg = {}
         if legend is True:
-            han = copy.copy(h[0])
-            han.set_alpha(0)
-            blank_handle = han
+            # a fresh empty artist is cheaper than cloning a plotted handle
+            # just to make it invisible
+            blank_handle = Line2D([], [], alpha=0)
 
             # find breakpoint between first plotting and overplotting
             breakpoint = len(missing_labels)
@@ -1059,7 +1069,9 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
                 pair_h, pair_l = pair[0], pair[1]
                 if len(pair_l) > 0:
                     if pair_l[0] not in trait_vars:
-                        pair_l.insert(0, [trait_var for trait_var in set(trait_vars) if trait_var != None][0])
+                        # trait_vars is already ordered and None-free; going through a set
+                        # here made the chosen section header non-deterministic
+                        pair_l.insert(0, trait_vars[0])
                         pair_h.insert(0, blank_handle)
             # legend has one section for each trait but ax.get_legend_handles_labels() yields straight lists
             # This code reorganizes legend information hierarchically starting with available and adding values
@@ -1117,8 +1129,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
             headers = lgd_kwargs.pop('headers', headers)
 
             for key in d_leg.keys():
-                han = copy.copy(h[0])
-                han.set_alpha(0)
+                han = Line2D([], [], alpha=0)
                 if headers is True:
                     handles.append(han)
                     # labels.append('$\\bf{}$'.format('{' + key + '}'))
@@ -1212,23 +1223,23 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
     # from ..core.geoseries import GeoSeries
 
     # if geos is not
-    if type(geos) != pd.DataFrame:  # in [MultipleGeoSeries, GeoSeries]:
+    if not isinstance(geos, pd.DataFrame):  # in [MultipleGeoSeries, GeoSeries]:
         df = make_df(geos, hue=hue, marker=marker, size=size)
-    elif type(geos) == pd.DataFrame:
+    elif isinstance(geos, pd.DataFrame):
         df = geos
         if hue not in df.columns:
             hue = None
         if marker not in df.columns:
             marker = None
 
-    gridspec_kwargs = {} if type(gridspec_kwargs) != dict else gridspec_kwargs
-    scatter_kwargs = {} if type(scatter_kwargs) != dict else scatter_kwargs
+    gridspec_kwargs = {} if not isinstance(gridspec_kwargs, dict) else gridspec_kwargs
+    scatter_kwargs = {} if not isinstance(scatter_kwargs, dict) else scatter_kwargs
     if 'marker_var' in scatter_kwargs:
         marker_var = scatter_kwargs.pop('marker_var')
     # scatter_kwargs['transform'] = ccrs.PlateCarree()
-    lgd_kwargs = {} if type(lgd_kwargs) != dict else lgd_kwargs
+    lgd_kwargs = {} if not isinstance(lgd_kwargs, dict) else lgd_kwargs
 
-    if proj_default is not True and type(proj_default) is not dict:
+    if proj_default is not True and not isinstance(proj_default, dict):
         raise TypeError('The default for the projections should either be provided' +
                         ' as a dictionary or set to True')
 
@@ -1305,7 +1316,7 @@ def scatter_map(geos, hue='archiveType', size=None, marker='archiveType', edgeco
     # Other extra information
     feature_d = {'borders': borders, 'lakes': lakes, 'rivers': rivers, 'land': land, 'ocean': ocean,
                  'coastline': coastline}
-    feature_d = {key: (value if type(value) == dict else {}) for key, value in feature_d.items() if value != False}
+    feature_d = {key: (value if isinstance(value, dict) else {}) for key, value in feature_d.items() if value != False}
     feature_spec_defaults = {'borders': dict(alpha=.5, linewidths=(.5,)), 'lakes': dict(alpha=0.25),
                              'rivers': {}, 'land': dict(alpha=0.5), 'ocean': dict(alpha=0.25),
                              'coastline': dict(linewidths=(.5,))}
@@ -13,6 +13,7 @@ from matplotlib import cm
 import numpy as np
 import pandas as pd
 import collections.abc
+from functools import lru_cache
 
 from ..utils import lipdutils
 
@@ -1146,6 +1147,44 @@ def label_intervals(fig, ax, labels, x_locs, orientation='north', overlapping_se
     return ax
 
 
+@lru_cache(maxsize=32)
+def _build_cmap(cmap_key, n):
+    '''Build (and cache) a colormap from a name or a tuple of colors.
+
+    Colormap construction samples the lookup table, so repeated plotting calls
+    with the same colormap spec reuse the cached instance. Callers go through
+    _get_cmap, which hashes the spec and hands out copies.
+    '''
+    if isinstance(cmap_key, tuple):
+        if n is None:
+            return mpl.colors.LinearSegmentedColormap.from_list("MyCmapName", list(cmap_key))
+        return mpl.colors.LinearSegmentedColormap.from_list("MyCmapName", list(cmap_key), N=n)
+    if n is None:
+        return plt.get_cmap(name=cmap_key)
+    return plt.get_cmap(name=cmap_key, lut=n)
+
+
+def _get_cmap(cmap, n):
+    '''Resolve a colormap spec (name, or list of colors incl. RGB(A) sequences)
+    through the cache, falling back to uncached construction for specs that
+    cannot be hashed.
+
+    A copy of the cached instance is returned, matching matplotlib's own
+    behavior, so caller mutations (e.g. set_bad/set_over) don't leak into
+    later calls.
+    '''
+    if isinstance(cmap, list):
+        try:
+            # RGB(A) entries arrive as lists/arrays; make the key fully hashable
+            cmap_key = tuple(tuple(c) if isinstance(c, (list, np.ndarray)) else c for c in cmap)
+            return copy.copy(_build_cmap(cmap_key, n))
+        except TypeError: # color spec that resists hashing: build without caching
+            if n is None:
+                return mpl.colors.LinearSegmentedColormap.from_list("MyCmapName", cmap)
+            return mpl.colors.LinearSegmentedColormap.from_list("MyCmapName", cmap, N=n)
+    return copy.copy(_build_cmap(cmap, n))
+
+
 def make_scalar_mappable(cmap=None, hue_vect=None, n=None, norm_kwargs=None):
     """
     Create a ScalarMappable object for mapping scalar data to colors.
@@ -1202,14 +1241,17 @@ def make_scalar_mappable(cmap=None, hue_vect=None, n=None, norm_kwargs=None):
             norm_kwargs['clip'] = False
 
         if all(isinstance(i, (int, float)) for i in hue_vect):
-            if np.any((norm_kwargs['vcenter'] < max(hue_vect)) | (norm_kwargs['vcenter'] > min(hue_vect))) == True:
+            # compute both extrema in one vectorized pass instead of repeated Python min/max scans
+            hue_arr = np.asarray(hue_vect, dtype=float)
+            hue_min, hue_max = np.nanmin(hue_arr), np.nanmax(hue_arr)
+            if (norm_kwargs['vcenter'] < hue_max) | (norm_kwargs['vcenter'] > hue_min):
                 if cmap is None:
                     cmap = 'vlag'
-                # ax_cmap = keep_center_colormap(cmap, min(hue_vect), max(hue_vect), center=0)
+                # ax_cmap = keep_center_colormap(cmap, hue_min, hue_max, center=0)
                 ax_norm = mpl.colors.CenteredNorm(
-                    **norm_kwargs)  # vcenter=0, clip=False)#TwoSlopeNorm(0, vmin=min(hue_vect), vmax=max(hue_vect)) #
+                    **norm_kwargs)  # vcenter=0, clip=False)#TwoSlopeNorm(0, vmin=hue_min, vmax=hue_max) #
             else:
-                ax_norm = mpl.colors.Normalize(vmin=min(hue_vect), vmax=max(hue_vect), clip=False)
+                ax_norm = mpl.colors.Normalize(vmin=hue_min, vmax=hue_max, clip=False)
                 if cmap is None:
                     cmap = 'viridis'
 
@@ -1225,16 +1267,8 @@ def make_scalar_mappable(cmap=None, hue_vect=None, n=None, norm_kwargs=None):
         #         cmap = 'viridis'
 
     if ax_cmap is None:
-        if type(cmap) == list:
-            if n is None:
-                ax_cmap = mpl.colors.LinearSegmentedColormap.from_list("MyCmapName", cmap)
-            else:
-                ax_cmap = mpl.colors.LinearSegmentedColormap.from_list("MyCmapName", cmap, N=n)
-        elif type(cmap) == str:
-            if n is None:
-                ax_cmap = plt.get_cmap(name=cmap)
-            else:
-                ax_cmap = plt.get_cmap(name=cmap, lut=n)
+        if isinstance(cmap, (list, str)):
+            ax_cmap = _get_cmap(cmap, n)
         else:
             print('what madness is this?')
     ax_sm = cm.ScalarMappable(norm=ax_norm, cmap=ax_cmap)
@@ -2,6 +2,7 @@
 '''
 
 import numpy as np
+import numba as nb
 # new for statsmodels v0.12
 from statsmodels.tsa.arima_process import arma_generate_sample
 from statsmodels.tsa.arima.model import ARIMA
@@ -32,9 +33,9 @@ __all__ = [
 ]
 
 
-def ar1_model(t, tau, output_sigma=1):
+def ar1_model(t, tau, output_sigma=1, rng=None):
     ''' Simulate AR(1) process with REDFIT
-    
+
     Simulate a (possibly irregularly-sampled) AR(1) process with given decay constant tau, à la REDFIT.
 
     Parameters
@@ -43,6 +44,9 @@ def ar1_model(t, tau, output_sigma=1):
         Time axis of the time series
     tau : float
         The averaged persistence
+    rng : numpy.random.Generator
+        Random number generator to draw the innovations from; uses the legacy
+        global numpy state if None (default)
 
     Returns
     -------
@@ -60,11 +64,14 @@ def ar1_model(t, tau, output_sigma=1):
     y = np.zeros(n)
     y[0] = 0  # initializing
 
+    gen = np.random if rng is None else rng
+    # precompute the transition coefficients and scale the pre-drawn shocks in
+    # vectorized passes; only the sequential recursion stays in the loop
+    rho = np.exp(-np.diff(t) / tau)
+    err = np.sqrt(1 - rho**2) * output_sigma
+    np.multiply(err, gen.standard_normal(n - 1), out=err)
     for i in range(1, n):
-        scaled_dt = (t[i] - t[i-1]) / tau
-        rho = np.exp(-scaled_dt)
-        err = np.random.normal(0, np.sqrt(1 - rho**2)*output_sigma, 1)
-        y[i] = y[i-1]*rho + err
+        y[i] = y[i-1]*rho[i-1] + err[i-1]
 
     return y
 
@@ -107,9 +114,9 @@ def ar1_fit(y, t=None):   ## is this still used anywhere? Looks redundant
 
 
 
-def ar1_sim(y, p, t=None):
+def ar1_sim(y, p, t=None, rng=None):
     '''Simulate AR(1) process(es) with sample autocorrelation value
-    
+
     Produce p realizations of an AR(1) process of length n with lag-1 autocorrelation g calculated from `y` and (if provided) `t`
 
     Will be replaced by uar1_sim in a future release
@@ -123,6 +130,9 @@ def ar1_sim(y, p, t=None):
         column dimension (number of surrogates)
     t : array
         the time axis of the series
+    rng : numpy.random.Generator
+        Random number generator to draw the innovations from; uses the legacy
+        global numpy state if None (default)
 
     Returns
     -------
@@ -154,15 +164,16 @@ def ar1_sim(y, p, t=None):
         sig_n = sig*np.sqrt(1-g**2)  # theoretical noise variance for the process to achieve the same variance as y
 
         # simulate AR(1) model for each column
+        distrvs = None if rng is None else rng.standard_normal
         for i in np.arange(p):
-            ysim[:, i] = arma_generate_sample(ar, ma, nsample=n, scale=sig_n, burnin=50) # statsmodels v0.12+
+            ysim[:, i] = arma_generate_sample(ar, ma, nsample=n, scale=sig_n, burnin=50, distrvs=distrvs) # statsmodels v0.12+
     else:
         #  tau_est = ar1_fit(y, t=t, detrend=detrend, params=params)
         tau_est = tau_estimation(y, t)
         for i in np.arange(p):
             # the output of ar1_model has unit variance,
             # multiply by sig to be consistent with the original input timeseries
-            ysim[:, i] = ar1_model(t, tau_est, output_sigma=sig)
+            ysim[:, i] = ar1_model(t, tau_est, output_sigma=sig, rng=rng)
 
     if p == 1:
         ysim = ysim[:, 0]
@@ -358,7 +369,7 @@ def sm_ar1_sim(n, p, g, sig):
     return red
 
 
-def colored_noise(alpha, t, std = 1.0, f0=None, m=None, seed=None):
+def colored_noise(alpha, t, std = 1.0, f0=None, m=None, seed=None, rng=None):
     ''' Generate a colored noise timeseries
 
     Parameters
@@ -380,8 +391,12 @@ def colored_noise(alpha, t, std = 1.0, f0=None, m=None, seed=None):
 
     seed : int
         seed for the random number generator
-        
-        
+
+    rng : numpy.random.Generator
+        Random number generator to draw the phases from; uses the legacy
+        global numpy state if None (default)
+
+
     Returns
     -------
     y : array
@@ -411,17 +426,18 @@ def colored_noise(alpha, t, std = 1.0, f0=None, m=None, seed=None):
     if seed is not None:
         np.random.seed(seed)
 
-    theta = np.random.rand(int(m))*2*np.pi  # random phase
+    gen = np.random if rng is None else rng
+    theta = gen.random(int(m))*2*np.pi  # random phase
     for j in range(n):
         coeff = (k*f0)**(-alpha/2)
         sin_func = np.sin(2*np.pi*k*f0*t[j] + theta)
         y[j] = np.sum(coeff*sin_func)
-    
+
     if std is not None:
-        ys, _, _ = standardize(y,scale=std) # rescale 
+        ys, _, _ = standardize(y,scale=std) # rescale
     else:
         ys = y
-        
+
     return ys
 
 def colored_noise_2regimes(alpha1, alpha2, f_break, t, f0=None, m=None, seed=None):
@@ -675,66 +691,128 @@ def uar1_fit(y, t):
     
     return theta_hat
 
-def uar1_sim(t, tau, sigma_2=1):  
-                               
+# Both kernels are compiled with cache=True: the machine code is written to
+# disk on the first call in a given environment, so every later process starts
+# warm. (numba.pycc ahead-of-time compilation was removed from numba and is no
+# longer an option for shipping a prebuilt extension.)
+@nb.jit(nopython=True, parallel=True, cache=True)
+def _uar1_sim_kernel_shared(t, tau, sigma_2, y):
+    ''' Numba kernel for the AR(1) recursion when all realizations share one time axis.
+
+    The transition coefficients only depend on the time increments, so they are
+    precomputed once instead of per realization. `y` holds the pre-drawn
+    innovations on entry and is turned into the AR(1) realizations in place:
+    at step i, y[i,j] on the right-hand side is still the raw innovation while
+    y[i-1,j] already holds the recursion value.
+    '''
+    n, p = y.shape
+    phi = np.empty(n)
+    sigma = np.empty(n)
+    for i in range(1, n):
+        delta_i = t[i] - t[i - 1]
+        phi[i] = np.exp(-delta_i / tau)
+        sigma[i] = np.sqrt(sigma_2 * (1 - phi[i] * phi[i]))
+    for j in nb.prange(p):
+        for i in range(1, n):
+            y[i, j] = phi[i] * y[i - 1, j] + sigma[i] * y[i, j]
+
+
+@nb.jit(nopython=True, parallel=True, cache=True)
+def _uar1_sim_kernel(t, tau, sigma_2, y):
+    ''' Numba kernel for the AR(1) recursion, parallel over realizations.
+
+    The innovations are drawn by the caller so that seeding semantics are
+    unchanged; `y` holds them on entry and is updated into the AR(1)
+    realizations in place (see _uar1_sim_kernel_shared).
+    '''
+    n, p = y.shape
+    for j in nb.prange(p):
+        for i in range(1, n):
+            delta_i = t[i, j] - t[i - 1, j]
+            phi = np.exp(-delta_i / tau)
+            sigma_i = np.sqrt(sigma_2 * (1 - phi * phi))
+            y[i, j] = phi * y[i - 1, j] + sigma_i * y[i, j]
+
+
+def uar1_sim(t, tau, sigma_2=1, number=None, rng=None):
+
     """
     Generate a time series of length n from an autoregressive process of order 1 with evenly/unevenly spaced time points.
-    
+
     Parameters
     ----------
     t : array
-        Time axis 
-        
+        Time axis; either 1D (shared by all realizations) or an (n, p) matrix
+        with one time axis per column
+
     tau : float
         Time decay parameter of the  AR(1) model ($\phi = e^{-\tau}$)
-        
+
     sigma_2 : float
-        Variance of the innovations      
-  
+        Variance of the innovations
+
+    number : int
+        Number of realizations drawn on a shared 1D time axis `t`. Passing the
+        1D axis with `number` avoids materializing an (n, number) matrix of
+        identical columns. Ignored if `t` is 2D. The default is None (one realization).
+
+    rng : numpy.random.Generator
+        Random number generator to draw the innovations from; uses the legacy
+        global numpy state if None (default)
+
     Returns
     -------
-    ys : n 
+    ys : n
         matrix of simulated AR(1) vector
-      
-          
+
+
     See also
     --------
-  
-    pyleoclim.utils.tsmodel.uar1_fit : Maximumum likelihood estimate of AR(1) parameters 
-        
+
+    pyleoclim.utils.tsmodel.uar1_fit : Maximumum likelihood estimate of AR(1) parameters
+
     """
-    if t.ndim == 1: # add extraneous dimension if t is 1d, to write only one loop. 
-        n = len(t); p = 1
-        t = t[:,np.newaxis]
+    shared_t = t.ndim == 1 # a 1d axis is shared by all realizations
+    if shared_t:
+        n = len(t); p = 1 if number is None else number
     else:
         n, p = t.shape
-    
-    # generate innovations
-    z = np.random.normal(loc=0, scale=1, size=(n,p))
-    y = np.copy(z) # initialize AR(1) vectors
-    # fill the array
-    for j in range(p):  # Note: this shouldn't work but it does!
-        for i in range(1, n): 
-            delta_i = t[i,j] - t[i-1,j] 
-            phi = np.exp(-delta_i / tau)
-            sigma_i = np.sqrt(sigma_2 * (1-phi**2))
-            y[i,j] = phi * y[i-1,j] + sigma_i * z[i,j]  
-    
+
+    # generate all innovations in one draw; the kernels update the buffer into
+    # the AR(1) realizations in place, so no second (n, p) array is allocated.
+    # drawing (p, n) and transposing yields an F-ordered buffer for free, so
+    # each realization is contiguous both for the per-column kernels and for
+    # the column views handed to Series downstream
+    gen = np.random if rng is None else rng
+    y = gen.normal(loc=0, scale=1, size=(p,n)).T
+    # fill the array; the recursion over time cannot be vectorized, so it is
+    # compiled with numba and parallelized over realizations
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    if shared_t:
+        _uar1_sim_kernel_shared(t, float(tau), float(sigma_2), y)
+    else:
+        _uar1_sim_kernel(t, float(tau), float(sigma_2), y)
+
     y = np.squeeze(y) # squeeze superfluous dimensions
     return y
 
 def inverse_cumsum(arr):
     return np.diff(np.concatenate(([0], arr)))
 
-def random_time_axis(n, delta_t_dist = "exponential", param = [1.0], seed = None):
+def random_time_axis(n, delta_t_dist = "exponential", param = [1.0], seed = None, number = None):
     '''
     Generate a random time axis according to a specific probability model
 
     Parameters
     ----------
     n: integer
-        The length of the time series 
-        
+        The length of the time series
+
+    number: integer, optional
+        If provided, generate `number` independent time axes in one batched draw,
+        returned as an (n, number) array (one realization per column).
+        The default is None, which returns a single 1D axis.
+
     delta_t_dist: str
         the probability distribution of the random time increments.
         possible choices include 'exponential', 'poisson', 'pareto', or 'random_choice'.
@@ -752,40 +830,44 @@ def random_time_axis(n, delta_t_dist = "exponential", param = [1.0], seed = None
         
     Returns
     -------
-    t : 1D array of random time axis obtained by taking the cumulative sum of the sampled random time increments, length n
+    t : array of random time axis obtained by taking the cumulative sum of the sampled random time increments;
+        1D of length n, or (n, number) if `number` is provided
 
 
     '''
     if seed is not None:
-        np.random.seed(seed) 
-    
-    # check for a valid distribution 
+        np.random.seed(seed)
+
+    # check for a valid distribution
     valid_distributions = ["exponential", "poisson", "pareto", "random_choice"]
     if delta_t_dist not in valid_distributions:
-        raise ValueError("delta_t_dist must be one of: 'exponential', 'poisson', 'pareto', 'random_choice'.")    
-    
+        raise ValueError("delta_t_dist must be one of: 'exponential', 'poisson', 'pareto', 'random_choice'.")
+
     param = np.array(param) # coerce array type
-    
+
+    # one RNG call covers all realizations when `number` is specified
+    size = n if number is None else (n, number)
+
     if delta_t_dist == "exponential":
         # make sure that param is of len 1
         if len(param) != 1:
-            raise ValueError('The Exponential law takes a single scale parameter.')       
-        delta_t = np.random.exponential(scale = param, size=n)
-        
+            raise ValueError('The Exponential law takes a single scale parameter.')
+        delta_t = np.random.exponential(scale = param, size=size)
+
     elif delta_t_dist == "poisson":
         if len(param) != 1:
-            raise ValueError('The Poisson law takes a single parameter.')       
-        delta_t = np.random.poisson(lam = param, size = n) + 1
+            raise ValueError('The Poisson law takes a single parameter.')
+        delta_t = np.random.poisson(lam = param, size = size) + 1
     elif delta_t_dist == "pareto":
         if len(param) != 2:
             raise ValueError('The Pareto law takes a shape and a scale parameter (in that order) ')
         else:
-            delta_t = (np.random.pareto(param[0], n) + 1) * param[1]
+            delta_t = (np.random.pareto(param[0], size) + 1) * param[1]
     elif delta_t_dist == "random_choice":
         if len(param)<2 or len(param[0]) != len(param[1]):
             raise ValueError("value_random_choice and prob_random_choice must have the same size.")
-        delta_t = np.random.choice(param[0], size=n, p=param[1])
-    return np.cumsum(delta_t)
+        delta_t = np.random.choice(param[0], size=size, p=param[1])
+    return np.cumsum(delta_t, axis=0)
 
 
 
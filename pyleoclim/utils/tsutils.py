@@ -1974,20 +1974,24 @@ def phaseran(recblk, nsurr):
     return surrblk
 
 
-def phaseran2(y, nsurr):
+def phaseran2(y, nsurr, rng=None):
     '''
-    Phase randomization of a time series y, of even or odd length. 
-    
+    Phase randomization of a time series y, of even or odd length.
+
     Closely follows this strategy: https://stackoverflow.com/q/39543002
 
     Parameters
     ----------
     y : array, length nt
         Signal to be scrambled
-        
+
     nsurr : int
         is the number of image block surrogates that you want to generate.
 
+    rng : numpy.random.Generator
+        Random number generator to draw the phases from; uses the legacy
+        global numpy state if None (default)
+
     Returns
     -------
     ysurr: array nt x nsurr
@@ -1995,29 +1999,30 @@ def phaseran2(y, nsurr):
 
     '''
     from scipy.fft import fft, ifft
-    nt = len(y); n2 = nt //2 
+    nt = len(y); n2 = nt //2
     ys = fft(y)
-    pow_ys = np.abs(ys) ** 2.
+    mag_ys = np.abs(ys)
     phase_ys = np.angle(ys)
-    ysurr = np.zeros((nt, nsurr))
-    
-    for i in range(nsurr):
-        phase_ysr = np.empty_like(phase_ys)
-        if nt % 2 == 0: # deal with even and odd-length arrays
-            phase_ysr_lh = np.random.rand(n2-1)
-            phase_ysr_rh = -phase_ysr_lh[::-1]
-            phase_ysr = np.concatenate((np.array((phase_ys[0],)), phase_ysr_lh,
-                                        np.array((phase_ys[n2],)),
-                                        phase_ysr_rh))
-        else:
-            phase_ysr_lh = np.random.rand(n2)
-            phase_ysr_rh = -phase_ysr_lh[::-1]
-            phase_ysr = np.concatenate((np.array((phase_ys[0],)), phase_ysr_lh, phase_ysr_rh))
-        # put it back together
-        ysrp = np.sqrt(pow_ys) * np.exp(2*np.pi*1j*phase_ysr) 
-        ysurr[:,i] = ifft(ysrp).real
-        
-            
+
+    # draw all random phases at once ((nsurr, nfreq) so each row matches the
+    # stream a per-surrogate loop would consume) and assemble an (nt, nsurr)
+    # phase matrix; DC (and Nyquist, for even nt) keep their original phases
+    gen = np.random if rng is None else rng
+    if nt % 2 == 0: # deal with even and odd-length arrays
+        phase_ysr_lh = gen.random((nsurr, n2-1)).T
+        phase_ysr = np.concatenate((np.full((1, nsurr), phase_ys[0]),
+                                    phase_ysr_lh,
+                                    np.full((1, nsurr), phase_ys[n2]),
+                                    -phase_ysr_lh[::-1]))
+    else:
+        phase_ysr_lh = gen.random((nsurr, n2)).T
+        phase_ysr = np.concatenate((np.full((1, nsurr), phase_ys[0]),
+                                    phase_ysr_lh,
+                                    -phase_ysr_lh[::-1]))
+    # put it back together, inverse-transforming all surrogates in one batched call
+    ysrp = mag_ys[:, np.newaxis] * np.exp(2*np.pi*1j*phase_ysr)
+    ysurr = ifft(ysrp, axis=0).real
+
     return ysurr
     
 